@@ -1,5 +1,5 @@
 import argparse
-from datetime import date, datetime
+from datetime import date
 
 from .io import load_daily_data, load_daily_payload as load_daily_payload_from_dict
 from .models import Goals
@@ -27,17 +27,16 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    config = load_config()
     if args.data:
         data = load_daily_data(args.data)
     else:
-        config = load_config()
-        day = date.fromisoformat(args.date) if args.date else datetime.now().date()
+        day = date.fromisoformat(args.date) if args.date else config.today()
         payload = load_daily_payload_from_sync(config, day.isoformat())
         data = load_daily_payload_from_dict(payload)
     goals = Goals.from_list(args.goals)
     report = build_daily_report(data, goals)
 
-    config = load_config()
     if config.database_url:
         records = load_research_recommendations_db(config, data.date)
         report.research_recommendations = [
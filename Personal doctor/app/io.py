@@ -1,17 +1,14 @@
-import json
 from pathlib import Path
 
-from dataclasses import fields
+import msgspec
 
 from .models import DailyData
 
 
 def load_daily_data(path: str | Path) -> DailyData:
-    payload = json.loads(Path(path).read_text())
-    return DailyData(**payload)
+    return msgspec.json.decode(Path(path).read_bytes(), type=DailyData, strict=False)
 
 
 def load_daily_payload(payload: dict) -> DailyData:
-    allowed = {field.name for field in fields(DailyData)}
-    filtered = {key: value for key, value in payload.items() if key in allowed}
-    return DailyData(**filtered)
+    # Unknown keys (e.g. "source") are ignored by msgspec.
+    return msgspec.convert(payload, DailyData, strict=False)
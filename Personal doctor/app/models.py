@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Sequence
+
+import msgspec
 
 from .research.models import ResearchRecommendation
 
 
-@dataclass
-class DailyData:
+class DailyData(msgspec.Struct, frozen=True):
     date: str
     sleep_hours: float
     sleep_quality: int
@@ -25,6 +26,20 @@ class DailyData:
     stress: int
 
 
+_GOAL_ALIASES: Dict[str, str] = {
+    "energy": "energy",
+    "reproductive": "reproductive_health",
+    "reproductive_health": "reproductive_health",
+    "semen": "reproductive_health",
+    "cognition": "cognition",
+    "cognitive": "cognition",
+    "focus": "cognition",
+    "sport": "sport_performance",
+    "sport_performance": "sport_performance",
+    "performance": "sport_performance",
+}
+
+
 @dataclass
 class Goals:
     energy: bool = False
@@ -34,26 +49,19 @@ class Goals:
 
     @classmethod
     def from_list(cls, goals: List[str]) -> "Goals":
-        normalized = {goal.strip().lower() for goal in goals}
-        return cls(
-            energy="energy" in normalized,
-            reproductive_health="reproductive" in normalized
-            or "reproductive_health" in normalized
-            or "semen" in normalized,
-            cognition="cognition" in normalized
-            or "cognitive" in normalized
-            or "focus" in normalized,
-            sport_performance="sport" in normalized
-            or "sport_performance" in normalized
-            or "performance" in normalized,
-        )
+        flags = {}
+        for goal in goals:
+            name = _GOAL_ALIASES.get(goal.strip().lower())
+            if name:
+                flags[name] = True
+        return cls(**flags)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Recommendation:
     category: str
     title: str
-    details: List[str] = field(default_factory=list)
+    details: Sequence[str] = ()
 
 
 @dataclass
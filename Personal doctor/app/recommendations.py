@@ -4,6 +4,72 @@ from typing import Dict, List
 
 from .models import DailyData, DailyReport, Goals, Recommendation
 
+# Static recommendations are shared across reports; only the diet one is dynamic.
+_SLEEP_RESET = Recommendation(
+    category="sleep",
+    title="Sleep recovery reset",
+    details=(
+        "Wind down 60 minutes before bed; no bright screens.",
+        "Aim for 7.5-8.5 hours tonight; shift bedtime 30-45 min earlier.",
+        "Stop caffeine by 2pm to improve sleep latency.",
+    ),
+)
+
+_HYDRATION_BOOST = Recommendation(
+    category="hydration",
+    title="Hydration boost",
+    details=(
+        "Add 0.8-1.2 L water today with electrolytes if training.",
+        "Front-load 500 ml before noon.",
+    ),
+)
+
+_POSTURE_BREAKS = Recommendation(
+    category="posture",
+    title="Posture & mobility breaks",
+    details=(
+        "Stand + stretch for 3-5 minutes every 45-60 min.",
+        "Add 8-12 min thoracic + hip mobility in the afternoon.",
+    ),
+)
+
+_ENERGY_FOCUS = Recommendation(
+    category="energy",
+    title="Energy focus",
+    details=(
+        "Prioritize slow-digesting carbs at breakfast (oats, berries).",
+        "Take a 10-15 min daylight walk after lunch.",
+    ),
+)
+
+_COGNITIVE_PERFORMANCE = Recommendation(
+    category="cognition",
+    title="Cognitive performance",
+    details=(
+        "Schedule 1-2 deep work blocks during peak alertness.",
+        "Add 1 serving omega-3 rich food (salmon, chia, walnuts).",
+    ),
+)
+
+_TRAINING_OPTIMIZATION = Recommendation(
+    category="training",
+    title="Training optimization",
+    details=(
+        "If recovery is moderate/strained, keep intensity at RPE 6-7.",
+        "Add 8-10 min activation warm-up (glutes, hamstrings, shoulders).",
+    ),
+)
+
+_REPRODUCTIVE_HEALTH = Recommendation(
+    category="reproductive",
+    title="Reproductive health",
+    details=(
+        "Aim for 7.5+ hours sleep; poor sleep reduces motility.",
+        "Add zinc/selenium rich foods (pumpkin seeds, eggs, seafood).",
+        "Limit heat exposure (saunas, hot baths) today.",
+    ),
+)
+
 
 def _signal_sleep(data: DailyData) -> str:
     if data.sleep_hours >= 7.5 and data.sleep_quality >= 7:
@@ -56,98 +122,33 @@ def build_daily_report(data: DailyData, goals: Goals) -> DailyReport:
         Recommendation(
             category="diet",
             title="Calorie + macro alignment",
-            details=[
-                f"Target protein 1.6 g/kg body weight; current {data.protein_g} g.",
+            details=(
+                f"Target protein 1.6 g/kg body weight; current {data.protein_g:g} g.",
                 "Add 1-2 servings of high-fiber carbs if energy dips.",
                 "Keep saturated fat < 10% calories to support cardiovascular health.",
-            ],
+            ),
         )
     )
 
     if signals["sleep"] == "poor":
-        recommendations.append(
-            Recommendation(
-                category="sleep",
-                title="Sleep recovery reset",
-                details=[
-                    "Wind down 60 minutes before bed; no bright screens.",
-                    "Aim for 7.5-8.5 hours tonight; shift bedtime 30-45 min earlier.",
-                    "Stop caffeine by 2pm to improve sleep latency.",
-                ],
-            )
-        )
+        recommendations.append(_SLEEP_RESET)
 
     if signals["hydration"] == "low":
-        recommendations.append(
-            Recommendation(
-                category="hydration",
-                title="Hydration boost",
-                details=[
-                    "Add 0.8-1.2 L water today with electrolytes if training.",
-                    "Front-load 500 ml before noon.",
-                ],
-            )
-        )
+        recommendations.append(_HYDRATION_BOOST)
 
     if signals["mobility"] != "balanced":
-        recommendations.append(
-            Recommendation(
-                category="posture",
-                title="Posture & mobility breaks",
-                details=[
-                    "Stand + stretch for 3-5 minutes every 45-60 min.",
-                    "Add 8-12 min thoracic + hip mobility in the afternoon.",
-                ],
-            )
-        )
+        recommendations.append(_POSTURE_BREAKS)
 
     if goals.energy:
-        recommendations.append(
-            Recommendation(
-                category="energy",
-                title="Energy focus",
-                details=[
-                    "Prioritize slow-digesting carbs at breakfast (oats, berries).",
-                    "Take a 10-15 min daylight walk after lunch.",
-                ],
-            )
-        )
+        recommendations.append(_ENERGY_FOCUS)
 
     if goals.cognition:
-        recommendations.append(
-            Recommendation(
-                category="cognition",
-                title="Cognitive performance",
-                details=[
-                    "Schedule 1-2 deep work blocks during peak alertness.",
-                    "Add 1 serving omega-3 rich food (salmon, chia, walnuts).",
-                ],
-            )
-        )
+        recommendations.append(_COGNITIVE_PERFORMANCE)
 
     if goals.sport_performance:
-        recommendations.append(
-            Recommendation(
-                category="training",
-                title="Training optimization",
-                details=[
-                    "If recovery is moderate/strained, keep intensity at RPE 6-7.",
-                    "Add 8-10 min activation warm-up (glutes, hamstrings, shoulders).",
-                ],
-            )
-        )
+        recommendations.append(_TRAINING_OPTIMIZATION)
 
     if goals.reproductive_health:
-        recommendations.append(
-            Recommendation(
-                category="reproductive",
-                title="Reproductive health",
-                details=[
-                    "Aim for 7.5+ hours sleep; poor sleep reduces motility.",
-                    "Add zinc/selenium rich foods (pumpkin seeds, eggs, seafood).",
-                    "Limit heat exposure (saunas, hot baths) today.",
-                ],
-            )
-        )
+        recommendations.append(_REPRODUCTIVE_HEALTH)
 
     return DailyReport(data=data, goals=goals, summary=summary, recommendations=recommendations, signals=signals)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Iterable, List
 
 import requests
 
 from .models import ResearchPaper
 from ..sync.config import SyncConfig
+from ..sync.http import make_session
 
 OPENALEX_BASE_URL = "https://api.openalex.org/works"
+MAX_CONCURRENT_JOURNALS = 8
+
+# Shared keep-alive session so journal fetches reuse TCP/TLS connections.
+_SESSION = make_session(pool_maxsize=MAX_CONCURRENT_JOURNALS)
 
 
 def _build_journal_filter(journal: str, mode: str = "exact") -> str:
@@ -25,7 +31,7 @@ def _fetch_with_filter(config: SyncConfig, filter_value: str, per_page: int) ->
     }
     if config.openalex_mailto:
         params["mailto"] = config.openalex_mailto
-    response = requests.get(OPENALEX_BASE_URL, params=params, timeout=30)
+    response = _SESSION.get(OPENALEX_BASE_URL, params=params, timeout=30)
     response.raise_for_status()
     return response.json()
 
@@ -38,33 +44,47 @@ def _fetch_with_search(config: SyncConfig, query: str, per_page: int) -> Dict:
     }
     if config.openalex_mailto:
         params["mailto"] = config.openalex_mailto
-    response = requests.get(OPENALEX_BASE_URL, params=params, timeout=30)
+    response = _SESSION.get(OPENALEX_BASE_URL, params=params, timeout=30)
     response.raise_for_status()
     return response.json()
 
 
+def _fetch_journal(config: SyncConfig, journal: str, per_page: int) -> Dict:
+    filter_value = _build_journal_filter(journal, mode="exact")
+    try:
+        return _fetch_with_filter(config, filter_value, per_page)
+    except requests.HTTPError as exc:
+        if exc.response is None or exc.response.status_code != 400:
+            raise
+    filter_value = _build_journal_filter(journal, mode="search")
+    try:
+        return _fetch_with_filter(config, filter_value, per_page)
+    except requests.HTTPError as exc_search:
+        if exc_search.response is None or exc_search.response.status_code != 400:
+            raise
+    return _fetch_with_search(config, journal, per_page)
+
+
 def fetch_top_papers(
     config: SyncConfig,
     journals: Iterable[str],
     per_page: int = 100,
 ) -> List[ResearchPaper]:
+    journal_list = list(journals)
+    if not journal_list:
+        return []
+    workers = min(MAX_CONCURRENT_JOURNALS, len(journal_list))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        payloads = list(
+            executor.map(
+                lambda journal: _fetch_journal(config, journal, per_page),
+                journal_list,
+            )
+        )
+
     papers: List[ResearchPaper] = []
     seen: set[str] = set()
-    for journal in journals:
-        filter_value = _build_journal_filter(journal, mode="exact")
-        try:
-            payload = _fetch_with_filter(config, filter_value, per_page)
-        except requests.HTTPError as exc:
-            if exc.response is None or exc.response.status_code != 400:
-                raise
-            filter_value = _build_journal_filter(journal, mode="search")
-            try:
-                payload = _fetch_with_filter(config, filter_value, per_page)
-            except requests.HTTPError as exc_search:
-                if exc_search.response is None or exc_search.response.status_code != 400:
-                    raise
-                payload = _fetch_with_search(config, journal, per_page)
-
+    for payload in payloads:
         results = payload.get("results", [])
         for item in results:
             work_id = item.get("id", "")
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from dataclasses import asdict
 from datetime import date
 from typing import Iterable, List
 
@@ -11,6 +10,7 @@ from ..sync.storage import (
     delete_research_papers_except,
     save_research_papers_db,
     save_research_recommendations_db,
+    transaction,
 )
 
 JOURNALS = ["The Lancet", "The New England Journal of Medicine", "JAMA"]
@@ -34,6 +34,8 @@ GOAL_ACTIONS = {
     ],
 }
 
+_GOAL_ACTION_PAIRS = tuple((goal, actions[0]) for goal, actions in GOAL_ACTIONS.items())
+
 
 def _estimate_impact_pct(cited_by_count: int) -> float:
     return round(min(12.0, 2.0 + cited_by_count / 500), 1)
@@ -46,9 +48,9 @@ def _build_recommendations(
     recommendations: List[ResearchRecommendation] = []
     if not paper_list:
         return recommendations
-    for idx, (goal, actions) in enumerate(GOAL_ACTIONS.items()):
-        paper = paper_list[min(idx, len(paper_list) - 1)]
-        action = actions[0]
+    last = len(paper_list) - 1
+    for idx, (goal, action) in enumerate(_GOAL_ACTION_PAIRS):
+        paper = paper_list[idx if idx < last else last]
         recommendations.append(
             ResearchRecommendation(
                 date=day,
@@ -71,24 +73,9 @@ def run_daily_research(
     config: SyncConfig, day: date, journals: Iterable[str] = JOURNALS
 ) -> List[ResearchRecommendation]:
     papers = fetch_top_papers(config, journals)
-    save_research_papers_db(config, day.isoformat(), [asdict(paper) for paper in papers])
-    delete_research_papers_except(config, day.isoformat())
     recommendations = _build_recommendations(day, papers)
-    save_research_recommendations_db(
-        config,
-        [
-            {
-                "date": rec.date.isoformat(),
-                "goal": rec.goal,
-                "action": rec.action,
-                "expected_impact_pct": rec.expected_impact_pct,
-                "evidence": rec.evidence,
-                "paper_title": rec.paper_title,
-                "journal": rec.journal,
-                "cited_by_count": rec.cited_by_count,
-                "url": rec.url,
-            }
-            for rec in recommendations
-        ],
-    )
+    with transaction(config) as conn:
+        save_research_papers_db(config, day.isoformat(), papers, conn=conn)
+        delete_research_papers_except(config, day.isoformat(), conn=conn)
+        save_research_recommendations_db(config, recommendations, conn=conn)
     return recommendations
@@ -1,19 +1,13 @@
 from __future__ import annotations
 
 import argparse
-from datetime import date, datetime
+import logging
+from datetime import date, timedelta
 from pathlib import Path
 
-from .config import load_config
-from .pipeline import load_oura_daily
-from .placeholders import load_annual_checkups, load_blood_tests, load_urine_tests
-from .storage import (
-    init_db,
-    save_daily_payload_db,
-    save_lab_document_db,
-    write_daily_json,
-    write_lab_document_json,
-)
+from .config import configure_logging, load_config
+
+logger = logging.getLogger(__name__)
 
 
 def main() -> None:
@@ -25,22 +19,53 @@ def main() -> None:
     )
     parser.add_argument("--date", help="ISO date (YYYY-MM-DD)")
     parser.add_argument("--path", help="Path to lab/check-up PDF")
+    parser.add_argument(
+        "--backfill-days",
+        type=int,
+        default=1,
+        help="Oura only: sync this many days ending at --date",
+    )
     args = parser.parse_args()
+    if args.backfill_days < 1:
+        parser.error("--backfill-days must be at least 1")
+    if args.backfill_days > 1 and args.source != "oura":
+        parser.error("--backfill-days is only supported with --source oura")
+    configure_logging()
 
-    day = date.fromisoformat(args.date) if args.date else datetime.now().date()
     config = load_config()
+    day = date.fromisoformat(args.date) if args.date else config.today()
 
     if config.database_url:
+        from .storage import init_db
+
         init_db(config)
 
+    if args.source == "oura" and args.backfill_days > 1:
+        from .pipeline import load_oura_range
+        from .storage import save_daily_payloads_db, write_daily_json
+
+        start = day - timedelta(days=args.backfill_days - 1)
+        payloads = load_oura_range(config, start, day)
+        if config.database_url:
+            save_daily_payloads_db(config, payloads)
+            logger.info("Saved %d daily payloads to Postgres.", len(payloads))
+        else:
+            for payload in payloads:
+                target = write_daily_json(config.data_dir, payload["date"], payload)
+                logger.info("Saved %s", target)
+        return
+
     if args.source == "oura":
+        from .pipeline import load_oura_daily
+        from .storage import save_daily_payload_db, write_daily_json
+
         payload = load_oura_daily(config, day)
         if config.database_url:
             save_daily_payload_db(config, payload)
-            print("Saved daily payload to Postgres.")
+            logger.info("Saved daily payload to Postgres.")
         else:
             target = write_daily_json(config.data_dir, day.isoformat(), payload)
-            print(f"Saved {target}")
+            logger.info("Saved %s", target)
         return
 
     if args.source == "research":
@@ -49,30 +74,50 @@ def main() -> None:
         from ..research.pipeline import run_daily_research
 
         run_daily_research(config, day)
-        print("Saved daily research recommendations to Postgres.")
+        logger.info("Saved daily research recommendations to Postgres.")
         return
 
     if not args.path:
         raise SystemExit("--path is required for blood/urine/annual sources")
 
+    from .pdf_extract import file_sha256
+    from .placeholders import load_annual_checkups, load_blood_tests, load_urine_tests
+    from .storage import (
+        lab_document_exists,
+        save_lab_document_db,
+        write_lab_document_json,
+    )
+
     path = Path(args.path)
+    sha256 = None
+    if config.database_url:
+        sha256 = file_sha256(path)
+        if lab_document_exists(config, sha256):
+            logger.info("Lab document already stored in Postgres; skipping.")
+            return
+
+    # DB mode already skips known PDFs by sha256, so a local text cache would only
+    # duplicate the medical record on disk.
+    cache_dir = None if config.database_url else config.data_dir / ".pdf_cache"
     if args.source == "blood":
-        payload = load_blood_tests(path)
+        payload = load_blood_tests(path, cache_dir, sha256)
     elif args.source == "urine":
-        payload = load_urine_tests(path)
+        payload = load_urine_tests(path, cache_dir, sha256)
     else:
-        payload = load_annual_checkups(path)
+        payload = load_annual_checkups(path, cache_dir, sha256)
 
     raw_text = payload.get("text", "")
     metadata = {k: v for k, v in payload.items() if k != "text"}
     if config.database_url:
-        save_lab_document_db(config, payload["kind"], day.isoformat(), raw_text, metadata)
-        print("Saved lab document to Postgres.")
+        save_lab_document_db(
+            config, payload["kind"], day.isoformat(), raw_text, metadata, sha256=sha256
+        )
+        logger.info("Saved lab document to Postgres.")
     else:
         target = write_lab_document_json(
             config.data_dir, payload["kind"], day.isoformat(), payload
         )
-        print(f"Saved {target}")
+        logger.info("Saved %s", target)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
+import logging
 import os
 from dataclasses import dataclass
+from datetime import date, datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
@@ -15,7 +18,12 @@ class SyncConfig:
     openalex_mailto: str | None
     oura_base_url: str = "https://api.ouraring.com/v2/usercollection"
 
+    def today(self) -> date:
+        """Current calendar date in the configured health timezone."""
+        return datetime.now(tz=self.timezone).date()
 
+
+@functools.lru_cache(maxsize=1)
 def load_config() -> SyncConfig:
     data_dir = Path(os.getenv("HEALTH_DATA_DIR", "data/ingested"))
     token = os.getenv("OURA_ACCESS_TOKEN")
@@ -29,3 +37,15 @@ def load_config() -> SyncConfig:
         database_url=database_url,
         openalex_mailto=openalex_mailto,
     )
+
+
+def configure_logging() -> None:
+    """Configure root logging for the sync entry points from LOG_LEVEL."""
+    level_name = os.getenv("LOG_LEVEL", "INFO").strip().upper()
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        raise SystemExit(f"Invalid LOG_LEVEL: {level_name!r}")
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from typing import Any, Dict, List
 
-import requests
-
 from ..config import SyncConfig
+from ..http import make_session
+
+_COLLECTIONS = (
+    ("sleep", "daily_sleep"),
+    ("activity", "daily_activity"),
+    ("readiness", "daily_readiness"),
+)
+
+# Shared keep-alive session so the collection requests reuse TCP/TLS connections.
+_SESSION = make_session(pool_maxsize=len(_COLLECTIONS))
 
 
 class OuraAPIError(RuntimeError):
@@ -20,27 +29,61 @@ def _fetch_collection(
     end_date: date,
 ) -> List[Dict[str, Any]]:
     url = f"{config.oura_base_url}/{collection}"
-    response = requests.get(
-        url,
-        headers={"Authorization": f"Bearer {token}"},
-        params={"start_date": start_date.isoformat(), "end_date": end_date.isoformat()},
-        timeout=30,
-    )
-    if response.status_code >= 400:
-        raise OuraAPIError(f"Oura API error {response.status_code}: {response.text}")
-    payload = response.json()
-    return payload.get("data", [])
+    params = {"start_date": start_date.isoformat(), "end_date": end_date.isoformat()}
+    records: List[Dict[str, Any]] = []
+    # Long ranges are paginated; follow next_token until the API reports no more.
+    while True:
+        response = _SESSION.get(
+            url,
+            headers={"Authorization": f"Bearer {token}"},
+            params=params,
+            timeout=30,
+        )
+        if response.status_code >= 400:
+            raise OuraAPIError(
+                f"Oura API error {response.status_code}: {response.text}"
+            )
+        payload = response.json()
+        records.extend(payload.get("data", []))
+        next_token = payload.get("next_token")
+        if not next_token:
+            return records
+        params = {**params, "next_token": next_token}
 
 
-def fetch_daily_summary(config: SyncConfig, day: date) -> Dict[str, Any]:
+def _fetch_collections(
+    config: SyncConfig, start_date: date, end_date: date
+) -> Dict[str, List[Dict[str, Any]]]:
     if not config.oura_access_token:
         raise OuraAPIError("Missing OURA_ACCESS_TOKEN")
     token = config.oura_access_token
-    sleep = _fetch_collection(config, token, "daily_sleep", day, day)
-    activity = _fetch_collection(config, token, "daily_activity", day, day)
-    readiness = _fetch_collection(config, token, "daily_readiness", day, day)
-    return {
-        "sleep": sleep[0] if sleep else {},
-        "activity": activity[0] if activity else {},
-        "readiness": readiness[0] if readiness else {},
-    }
+    with ThreadPoolExecutor(max_workers=len(_COLLECTIONS)) as executor:
+        futures = {
+            key: executor.submit(
+                _fetch_collection, config, token, collection, start_date, end_date
+            )
+            for key, collection in _COLLECTIONS
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+
+def fetch_daily_summary(config: SyncConfig, day: date) -> Dict[str, Any]:
+    collections = _fetch_collections(config, day, day)
+    return {key: records[0] if records else {} for key, records in collections.items()}
+
+
+def fetch_daily_summaries(
+    config: SyncConfig, start_date: date, end_date: date
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch sleep/activity/readiness for a date range, grouped by ISO day."""
+    summaries: Dict[str, Dict[str, Any]] = {}
+    for key, records in _fetch_collections(config, start_date, end_date).items():
+        for record in records:
+            day = record.get("day")
+            if not day:
+                continue
+            summary = summaries.setdefault(
+                day, {"sleep": {}, "activity": {}, "readiness": {}}
+            )
+            summary[key] = record
+    return summaries
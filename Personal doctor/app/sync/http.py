@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# Transient throttling/5xx responses are retried with backoff, honoring Retry-After.
+# The final response is returned rather than raised so callers keep their own checks.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+def make_session(pool_maxsize: int) -> requests.Session:
+    """Build a keep-alive session that retries transient HTTPS failures."""
+    session = requests.Session()
+    session.mount(
+        "https://", HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=_RETRY)
+    )
+    return session
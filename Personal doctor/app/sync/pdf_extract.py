@@ -1,19 +1,112 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict
-
-from pypdf import PdfReader
-
-
-def extract_pdf_text(path: Path) -> Dict[str, str]:
-    reader = PdfReader(str(path))
-    text_chunks = []
-    for page in reader.pages:
-        page_text = page.extract_text() or ""
-        text_chunks.append(page_text)
-    return {
-        "text": "\n".join(text_chunks).strip(),
-        "pages": str(len(reader.pages)),
-        "filename": path.name,
-    }
+from typing import Dict, List, Tuple
+
+import orjson
+import pymupdf
+
+from .storage import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+
+def file_sha256(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+@functools.cache
+def _tessdata() -> str | None:
+    # Honors TESSDATA_PREFIX, else looks for a tesseract-ocr install.
+    return pymupdf.get_tessdata() or None
+
+
+def _page_text(page: pymupdf.Page) -> str:
+    text = page.get_text("text")
+    if text.strip():
+        return text
+    # Scanned pages carry no text layer; OCR them if Tesseract is available.
+    tessdata = _tessdata()
+    if tessdata is None:
+        logger.warning(
+            "Page %d of %s has no text layer and Tesseract OCR is not available.",
+            page.number + 1,
+            page.parent.name,
+        )
+        return ""
+    try:
+        textpage = page.get_textpage_ocr(tessdata=tessdata)
+    except RuntimeError as exc:
+        logger.warning(
+            "OCR failed on page %d of %s: %s", page.number + 1, page.parent.name, exc
+        )
+        return ""
+    return page.get_text("text", textpage=textpage)
+
+
+def _ocr_page_range(job: Tuple[str, List[int]]) -> List[str]:
+    # Runs in a worker process: each worker opens its own document handle.
+    path, indices = job
+    with pymupdf.open(path) as doc:
+        return [_page_text(doc[index]) for index in indices]
+
+
+def _ocr_parallel(path: Path, indices: List[int], workers: int) -> List[str]:
+    step = -(-len(indices) // workers)
+    jobs = [
+        (str(path), indices[start : start + step])
+        for start in range(0, len(indices), step)
+    ]
+    # Spawn rather than fork: the caller may already hold a DB pool with live
+    # worker threads, and forking a multi-threaded process can deadlock.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        return [text for chunk in executor.map(_ocr_page_range, jobs) for text in chunk]
+
+
+def extract_pdf_text(
+    path: Path, cache_dir: Path | None = None, sha256: str | None = None
+) -> Dict[str, str]:
+    """Extract text from a PDF, reusing a cached result keyed by file content.
+
+    Pass ``sha256`` when the caller has already hashed the file.
+    """
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = cache_dir / f"{sha256 or file_sha256(path)}.json"
+        try:
+            cached = orjson.loads(cache_file.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            # Missing or unreadable entries are treated as a miss and rewritten.
+            pass
+        else:
+            return {**cached, "filename": path.name}
+
+    with pymupdf.open(path) as doc:
+        page_count = doc.page_count
+        texts = [page.get_text("text") for page in doc]
+        scanned = [index for index, text in enumerate(texts) if not text.strip()]
+        # Text-layer extraction costs milliseconds per page, far below a worker's
+        # ~0.3 s spawn cost, so only OCR (seconds per page) is spread over processes.
+        workers = min(os.cpu_count() or 1, len(scanned)) if _tessdata() else 1
+        if workers < 2:
+            for index in scanned:
+                texts[index] = _page_text(doc[index])
+    if workers >= 2:
+        for index, text in zip(scanned, _ocr_parallel(path, scanned, workers)):
+            texts[index] = text
+    extracted = {"text": "\n".join(texts).strip(), "pages": str(page_count)}
+
+    # Empty text (e.g. a scan on a host without Tesseract) is not cached so a
+    # later run with OCR available can still extract it.
+    if cache_file is not None and extracted["text"]:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(cache_file, orjson.dumps(extracted))
+    return {**extracted, "filename": path.name}
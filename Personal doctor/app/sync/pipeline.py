@@ -1,10 +1,22 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from .config import SyncConfig
-from .connectors.oura import fetch_daily_summary
+from .connectors.oura import fetch_daily_summaries, fetch_daily_summary
+
+# Fields Oura does not report; they stay zero until entered manually.
+_MANUAL_FIELD_DEFAULTS: Dict[str, Any] = {
+    "calories": 0,
+    "protein_g": 0,
+    "carbs_g": 0,
+    "fat_g": 0,
+    "water_l": 0,
+    "sitting_hours": 0,
+    "mood": 0,
+    "stress": 0,
+}
 
 
 def oura_to_daily_payload(day: date, summary: Dict[str, Any]) -> Dict[str, Any]:
@@ -28,14 +40,7 @@ def oura_to_daily_payload(day: date, summary: Dict[str, Any]) -> Dict[str, Any]:
         "active_minutes": int(active_minutes),
         "resting_hr": int(resting_hr),
         "hrv": float(hrv),
-        "calories": 0,
-        "protein_g": 0,
-        "carbs_g": 0,
-        "fat_g": 0,
-        "water_l": 0,
-        "sitting_hours": 0,
-        "mood": 0,
-        "stress": 0,
+        **_MANUAL_FIELD_DEFAULTS,
         "source": "oura",
     }
 
@@ -43,3 +48,11 @@ def oura_to_daily_payload(day: date, summary: Dict[str, Any]) -> Dict[str, Any]:
 def load_oura_daily(config: SyncConfig, day: date) -> Dict[str, Any]:
     summary = fetch_daily_summary(config, day)
     return oura_to_daily_payload(day, summary)
+
+
+def load_oura_range(config: SyncConfig, start: date, end: date) -> List[Dict[str, Any]]:
+    summaries = fetch_daily_summaries(config, start, end)
+    return [
+        oura_to_daily_payload(date.fromisoformat(day), summaries[day])
+        for day in sorted(summaries)
+    ]
@@ -1,65 +1,78 @@
 from __future__ import annotations
 
-import time
-
+import logging
+import signal
+import threading
 
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 
-from .config import load_config
+from ..research.pipeline import run_daily_research
+from .config import SyncConfig, configure_logging, load_config
 from .pipeline import load_oura_daily
-from .storage import init_db, save_daily_payload_db, write_daily_json
+from .storage import close_pools, init_db, save_daily_payload_db, write_daily_json
+
+logger = logging.getLogger(__name__)
 
 
 def start_scheduler() -> None:
+    configure_logging()
     config = load_config()
-    scheduler = BackgroundScheduler(timezone=config.timezone)
-    scheduler.add_job(run_oura_sync, "cron", hour=7, minute=0, id="oura_daily")
+    if config.database_url:
+        # Create the schema once up front so concurrent jobs don't race on DDL.
+        init_db(config)
+    scheduler = BackgroundScheduler(
+        timezone=config.timezone,
+        executors={"default": ThreadPoolExecutor(4)},
+    )
+    # The Oura and research syncs are independent, so they run side by side.
+    scheduler.add_job(
+        run_oura_sync, "cron", hour=7, minute=0, id="oura_daily", args=[config]
+    )
     scheduler.add_job(
         run_research_sync,
         "cron",
         hour=7,
-        minute=10,
+        minute=0,
         id="research_daily",
+        args=[config],
     )
     scheduler.start()
-    print("Scheduler started: Oura daily at 07:00, research at 07:10")
+    logger.info("Scheduler started: Oura and research daily at 07:00")
 
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
     try:
-        while True:
-            time.sleep(60)
-    except KeyboardInterrupt:
-        scheduler.shutdown()
-
-
-if __name__ == "__main__":
-    start_scheduler()
-
+        stop.wait()
+    finally:
+        scheduler.shutdown(wait=True)
+        close_pools()
 
-def run_oura_sync() -> None:
-    from datetime import datetime
 
-    config = load_config()
-    day = datetime.now(tz=config.timezone).date()
+def run_oura_sync(config: SyncConfig | None = None) -> None:
+    config = config or load_config()
+    day = config.today()
     if config.database_url:
         init_db(config)
     payload = load_oura_daily(config, day)
     if config.database_url:
         save_daily_payload_db(config, payload)
-        print("Saved daily payload to Postgres.")
+        logger.info("Saved daily payload to Postgres.")
     else:
         target = write_daily_json(config.data_dir, day.isoformat(), payload)
-        print(f"Saved {target}")
+        logger.info("Saved %s", target)
 
 
-def run_research_sync() -> None:
-    from datetime import datetime
-
-    config = load_config()
-    day = datetime.now(tz=config.timezone).date()
+def run_research_sync(config: SyncConfig | None = None) -> None:
+    config = config or load_config()
+    day = config.today()
     if not config.database_url:
         raise RuntimeError("DATABASE_URL is required for research sync")
     init_db(config)
-    from ..research.pipeline import run_daily_research
-
     run_daily_research(config, day)
-    print("Saved daily research recommendations to Postgres.")
+    logger.info("Saved daily research recommendations to Postgres.")
+
+
+if __name__ == "__main__":
+    start_scheduler()
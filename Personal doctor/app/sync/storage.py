@@ -1,18 +1,132 @@
 from __future__ import annotations
 
-import json
+import atexit
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List
 
-import psycopg
+import orjson
 
 from .config import SyncConfig
+from ..research.models import ResearchPaper, ResearchRecommendation
 
+if TYPE_CHECKING:
+    from psycopg import Connection
+    from psycopg_pool import ConnectionPool
 
-def write_daily_json(data_dir: Path, date: str, payload: Dict[str, Any]) -> Path:
+_POOLS: Dict[str, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+_DB_INITIALIZED: set[str] = set()
+
+
+def _get_pool(config: SyncConfig) -> ConnectionPool:
+    with _POOLS_LOCK:
+        pool = _POOLS.get(config.database_url)
+        if pool is None:
+            # psycopg is imported on first use so file-only runs never load it.
+            from psycopg.types.json import set_json_dumps, set_json_loads
+            from psycopg_pool import ConnectionPool
+
+            # Route psycopg's json/jsonb adaptation through orjson.
+            set_json_dumps(orjson.dumps)
+            set_json_loads(orjson.loads)
+            # The scheduler leaves connections idle between daily runs; check each
+            # one on checkout so a Postgres restart or dropped idle socket is
+            # replaced instead of failing the job.
+            pool = ConnectionPool(
+                config.database_url,
+                min_size=1,
+                max_size=4,
+                open=True,
+                check=ConnectionPool.check_connection,
+            )
+            _POOLS[config.database_url] = pool
+        return pool
+
+
+@contextmanager
+def _connection(
+    config: SyncConfig, conn: Connection | None = None
+) -> Iterator[Connection]:
+    if conn is not None:
+        yield conn
+        return
+    with _get_pool(config).connection() as pooled:
+        yield pooled
+
+
+@contextmanager
+def transaction(config: SyncConfig) -> Iterator[Connection]:
+    """Yield a pooled connection wrapped in a single transaction."""
+    if not config.database_url:
+        raise ValueError("DATABASE_URL is required for Postgres storage")
+    with _get_pool(config).connection() as conn, conn.transaction():
+        yield conn
+
+
+def close_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_pools)
+
+
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: os.umask can only be queried by setting it, which is not
+# thread-safe once the scheduler's workers are running.
+_UMASK = _current_umask()
+
+
+def atomic_write_bytes(target: Path, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        # mkstemp creates 0600 files; keep the mode a plain write would have given.
+        try:
+            mode = target.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.fchmod(fd, mode)
+        handle = os.fdopen(fd, "wb")
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp)
+        raise
+    try:
+        with handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _dump_json(payload: Dict[str, Any], sort_keys: bool) -> bytes:
+    option = orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    return orjson.dumps(payload, option=option)
+
+
+def write_daily_json(
+    data_dir: Path, date: str, payload: Dict[str, Any], sort_keys: bool = False
+) -> Path:
     data_dir.mkdir(parents=True, exist_ok=True)
     target = data_dir / f"daily_{date}.json"
-    target.write_text(json.dumps(payload, indent=2, sort_keys=True))
+    atomic_write_bytes(target, _dump_json(payload, sort_keys))
     return target
 
 
@@ -21,76 +135,85 @@ def write_lab_document_json(
     kind: str,
     date: str,
     payload: Dict[str, Any],
+    sort_keys: bool = False,
 ) -> Path:
+    """Write lab metadata as JSON, with the raw text in a sibling .txt file."""
     data_dir.mkdir(parents=True, exist_ok=True)
     target = data_dir / f"{kind}_{date}.json"
-    target.write_text(json.dumps(payload, indent=2, sort_keys=True))
+    metadata = {key: value for key, value in payload.items() if key != "text"}
+    if "text" in payload:
+        text_target = target.with_suffix(".txt")
+        atomic_write_bytes(text_target, payload["text"].encode("utf-8"))
+        metadata["text_file"] = text_target.name
+    atomic_write_bytes(target, _dump_json(metadata, sort_keys))
     return target
 
 
+_SCHEMA_DDL = """
+create table if not exists daily_data (
+    date date primary key,
+    source text not null,
+    payload jsonb not null,
+    created_at timestamptz default now()
+);
+
+create table if not exists research_papers (
+    work_id text primary key,
+    journal text not null,
+    title text not null,
+    cited_by_count int not null,
+    publication_date text,
+    url text,
+    date date not null,
+    created_at timestamptz default now()
+);
+
+create table if not exists research_recommendations (
+    id serial primary key,
+    date date not null,
+    goal text not null,
+    action text not null,
+    expected_impact_pct double precision not null,
+    evidence text not null,
+    paper_title text not null,
+    journal text not null,
+    cited_by_count int not null,
+    url text,
+    created_at timestamptz default now()
+);
+
+create unique index if not exists research_recommendations_date_goal_key
+    on research_recommendations (date, goal);
+
+create table if not exists lab_documents (
+    id serial primary key,
+    kind text not null,
+    date date not null,
+    raw_text text not null,
+    metadata jsonb,
+    created_at timestamptz default now()
+);
+
+alter table lab_documents add column if not exists sha256 text unique;
+"""
+
+
 def init_db(config: SyncConfig) -> None:
     if not config.database_url:
         raise ValueError("DATABASE_URL is required for Postgres storage")
-    with psycopg.connect(config.database_url) as conn:
-        conn.execute(
-            """
-            create table if not exists daily_data (
-                date date primary key,
-                source text not null,
-                payload jsonb not null,
-                created_at timestamptz default now()
-            );
-            """
-        )
-        conn.execute(
-            """
-            create table if not exists research_papers (
-                work_id text primary key,
-                journal text not null,
-                title text not null,
-                cited_by_count int not null,
-                publication_date text,
-                url text,
-                date date not null,
-                created_at timestamptz default now()
-            );
-            """
-        )
-        conn.execute(
-            """
-            create table if not exists research_recommendations (
-                id serial primary key,
-                date date not null,
-                goal text not null,
-                action text not null,
-                expected_impact_pct double precision not null,
-                evidence text not null,
-                paper_title text not null,
-                journal text not null,
-                cited_by_count int not null,
-                url text,
-                created_at timestamptz default now()
-            );
-            """
-        )
-        conn.execute(
-            """
-            create table if not exists lab_documents (
-                id serial primary key,
-                kind text not null,
-                date date not null,
-                raw_text text not null,
-                metadata jsonb,
-                created_at timestamptz default now()
-            );
-            """
-        )
+    if config.database_url in _DB_INITIALIZED:
+        return
+    with _get_pool(config).connection() as conn, conn.transaction():
+        conn.execute(_SCHEMA_DDL)
+    _DB_INITIALIZED.add(config.database_url)
 
 
 def save_daily_payload_db(config: SyncConfig, payload: Dict[str, Any]) -> None:
     if not config.database_url:
         raise ValueError("DATABASE_URL is required for Postgres storage")
-    with psycopg.connect(config.database_url) as conn:
+    from psycopg.types.json import Jsonb
+
+    with _get_pool(config).connection() as conn:
         conn.execute(
             """
             insert into daily_data (date, source, payload)
@@ -98,56 +221,135 @@ def save_daily_payload_db(config: SyncConfig, payload: Dict[str, Any]) -> None:
             on conflict (date)
             do update set source = excluded.source, payload = excluded.payload;
             """,
-            (payload["date"], payload.get("source", "unknown"), json.dumps(payload)),
+            (
+                payload["date"],
+                payload.get("source", "unknown"),
+                Jsonb(payload),
+            ),
+            prepare=True,
         )
 
 
+def save_daily_payloads_db(
+    config: SyncConfig, payloads: Iterable[Dict[str, Any]]
+) -> None:
+    """Upsert many daily payloads at once via COPY into a staging table."""
+    if not config.database_url:
+        raise ValueError("DATABASE_URL is required for Postgres storage")
+    from psycopg.types.json import Jsonb
+
+    rows = [
+        (payload["date"], payload.get("source", "unknown"), Jsonb(payload))
+        for payload in payloads
+    ]
+    if not rows:
+        return
+    with _get_pool(config).connection() as conn, conn.transaction():
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                create temp table daily_data_staging
+                    (like daily_data including defaults);
+                """
+            )
+            with cur.copy(
+                "copy daily_data_staging (date, source, payload) from stdin;"
+            ) as copy:
+                for row in rows:
+                    copy.write_row(row)
+            cur.execute(
+                """
+                insert into daily_data (date, source, payload)
+                select date, source, payload
+                  from daily_data_staging
+                on conflict (date)
+                do update set source = excluded.source, payload = excluded.payload;
+                """
+            )
+            cur.execute("drop table daily_data_staging;")
+
+
 def save_lab_document_db(
     config: SyncConfig,
     kind: str,
     date: str,
     raw_text: str,
     metadata: Dict[str, Any],
+    sha256: str | None = None,
 ) -> None:
     if not config.database_url:
         raise ValueError("DATABASE_URL is required for Postgres storage")
-    with psycopg.connect(config.database_url) as conn:
+    from psycopg.types.json import Jsonb
+
+    with _get_pool(config).connection() as conn:
         conn.execute(
             """
-            insert into lab_documents (kind, date, raw_text, metadata)
-            values (%s, %s, %s, %s);
+            insert into lab_documents (kind, date, raw_text, metadata, sha256)
+            values (%s, %s, %s, %s, %s)
+            on conflict (sha256) do nothing;
             """,
-            (kind, date, raw_text, json.dumps(metadata)),
+            (kind, date, raw_text, Jsonb(metadata), sha256),
         )
 
 
+def lab_document_exists(config: SyncConfig, sha256: str) -> bool:
+    if not config.database_url:
+        raise ValueError("DATABASE_URL is required for Postgres storage")
+    with _get_pool(config).connection() as conn:
+        row = conn.execute(
+            "select 1 from lab_documents where sha256 = %s;",
+            (sha256,),
+        ).fetchone()
+    return row is not None
+
+
 def save_research_papers_db(
-    config: SyncConfig, date: str, papers: Iterable[Dict[str, Any]]
+    config: SyncConfig,
+    date: str,
+    papers: Iterable[ResearchPaper],
+    conn: Connection | None = None,
 ) -> None:
     if not config.database_url:
         raise ValueError("DATABASE_URL is required for Postgres storage")
     payload = [
         (
-            paper["work_id"],
-            paper["journal"],
-            paper["title"],
-            int(paper["cited_by_count"]),
-            paper.get("publication_date"),
-            paper.get("url"),
+            paper.work_id,
+            paper.journal,
+            paper.title,
+            paper.cited_by_count,
+            paper.publication_date,
+            paper.url,
             date,
         )
         for paper in papers
     ]
     if not payload:
         return
-    with psycopg.connect(config.database_url) as conn:
+    with _connection(config, conn) as conn, conn.transaction():
         with conn.cursor() as cur:
-            cur.executemany(
+            cur.execute(
+                """
+                create temp table research_papers_staging
+                    (like research_papers including defaults);
+                """
+            )
+            with cur.copy(
+                """
+                copy research_papers_staging (
+                    work_id, journal, title, cited_by_count, publication_date, url, date
+                )
+                from stdin;
+                """
+            ) as copy:
+                for row in payload:
+                    copy.write_row(row)
+            cur.execute(
                 """
                 insert into research_papers (
                     work_id, journal, title, cited_by_count, publication_date, url, date
                 )
-                values (%s, %s, %s, %s, %s, %s, %s)
+                select work_id, journal, title, cited_by_count, publication_date, url, date
+                  from research_papers_staging
                 on conflict (work_id)
                 do update set
                     journal = excluded.journal,
@@ -156,15 +358,17 @@ def save_research_papers_db(
                     publication_date = excluded.publication_date,
                     url = excluded.url,
                     date = excluded.date;
-                """,
-                payload,
+                """
             )
+            cur.execute("drop table research_papers_staging;")
 
 
-def delete_research_papers_except(config: SyncConfig, date: str) -> None:
+def delete_research_papers_except(
+    config: SyncConfig, date: str, conn: Connection | None = None
+) -> None:
     if not config.database_url:
         raise ValueError("DATABASE_URL is required for Postgres storage")
-    with psycopg.connect(config.database_url) as conn:
+    with _connection(config, conn) as conn:
         conn.execute(
             "delete from research_papers where date <> %s;",
             (date,),
@@ -172,42 +376,54 @@ def delete_research_papers_except(config: SyncConfig, date: str) -> None:
 
 
 def save_research_recommendations_db(
-    config: SyncConfig, recommendations: Iterable[Dict[str, Any]]
+    config: SyncConfig,
+    recommendations: Iterable[ResearchRecommendation],
+    conn: Connection | None = None,
 ) -> None:
     if not config.database_url:
         raise ValueError("DATABASE_URL is required for Postgres storage")
     payload = [
         (
-            rec["date"],
-            rec["goal"],
-            rec["action"],
-            float(rec["expected_impact_pct"]),
-            rec["evidence"],
-            rec["paper_title"],
-            rec["journal"],
-            int(rec["cited_by_count"]),
-            rec.get("url"),
+            rec.date,
+            rec.goal,
+            rec.action,
+            rec.expected_impact_pct,
+            rec.evidence,
+            rec.paper_title,
+            rec.journal,
+            rec.cited_by_count,
+            rec.url,
         )
         for rec in recommendations
     ]
     if not payload:
         return
-    with psycopg.connect(config.database_url) as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                "delete from research_recommendations where date = %s;",
-                (payload[0][0],),
-            )
-            cur.executemany(
-                """
-                insert into research_recommendations (
-                    date, goal, action, expected_impact_pct, evidence,
-                    paper_title, journal, cited_by_count, url
-                )
-                values (%s, %s, %s, %s, %s, %s, %s, %s, %s);
-                """,
-                payload,
+    # One column array per field lets a single statement upsert every row.
+    columns = [list(column) for column in zip(*payload)]
+    with _connection(config, conn) as conn:
+        conn.execute(
+            """
+            insert into research_recommendations (
+                date, goal, action, expected_impact_pct, evidence,
+                paper_title, journal, cited_by_count, url
             )
+            select *
+              from unnest(
+                  %s::date[], %s::text[], %s::text[], %s::double precision[],
+                  %s::text[], %s::text[], %s::text[], %s::int[], %s::text[]
+              )
+            on conflict (date, goal)
+            do update set
+                action = excluded.action,
+                expected_impact_pct = excluded.expected_impact_pct,
+                evidence = excluded.evidence,
+                paper_title = excluded.paper_title,
+                journal = excluded.journal,
+                cited_by_count = excluded.cited_by_count,
+                url = excluded.url;
+            """,
+            columns,
+        )
 
 
 def load_research_recommendations_db(
@@ -215,7 +431,7 @@ def load_research_recommendations_db(
 ) -> List[Dict[str, Any]]:
     if not config.database_url:
         raise ValueError("DATABASE_URL is required for Postgres storage")
-    with psycopg.connect(config.database_url) as conn:
+    with _get_pool(config).connection() as conn:
         rows = conn.execute(
             """
             select goal, action, expected_impact_pct, evidence,
@@ -244,7 +460,7 @@ def load_research_recommendations_db(
 def load_daily_payload_db(config: SyncConfig, date: str) -> Dict[str, Any]:
     if not config.database_url:
         raise ValueError("DATABASE_URL is required for Postgres storage")
-    with psycopg.connect(config.database_url) as conn:
+    with _get_pool(config).connection() as conn:
         row = conn.execute(
             "select payload from daily_data where date = %s;",
             (date,),
@@ -258,7 +474,7 @@ def load_daily_payload_file(data_dir: Path, date: str) -> Dict[str, Any]:
     target = data_dir / f"daily_{date}.json"
     if not target.exists():
         raise FileNotFoundError(f"No daily payload file found at {target}")
-    return json.loads(target.read_text())
+    return orjson.loads(target.read_bytes())
 
 
 def load_daily_payload(config: SyncConfig, date: str) -> Dict[str, Any]: